@@ -1,22 +1,286 @@
-import PyPDF2
+from pypdf import PdfReader, PdfWriter
+from pypdf.generic import IndirectObject, StreamObject
+import io
+import logging
+import mmap
+import multiprocessing
 import os
+import re
+import shutil
+import subprocess
 import sys
+import threading
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
                             QHBoxLayout, QPushButton, QLabel, QListWidget,
                             QFileDialog, QLineEdit, QTextEdit, QMessageBox,
                             QProgressBar, QGroupBox, QTabWidget, QComboBox, QRadioButton, QButtonGroup)
-from PyQt6.QtCore import Qt, QThread, pyqtSignal
+from PyQt6.QtCore import Qt, QObject, QRunnable, QThreadPool, QTimer, pyqtSignal
 from PyQt6.QtGui import QFont
 
-def merge_pdfs_by_order(pdf_folder="files", output_filename="merged_output.pdf", exclude_output=True):
+logger = logging.getLogger(__name__)
+
+# Headroom added to the summed input size when pre-sizing a mapped output file
+_OUTPUT_SIZE_MARGIN = 1024 * 1024
+
+# Inputs smaller than this are read into memory in one go; mapping them costs more than it saves
+_MMAP_MIN_SIZE = 1024 * 1024
+
+_DIGIT_RUNS = re.compile(r'(\d+)')
+
+# zlib level used for each compression preset; level 1 is several times faster
+# than the default 6 for a few percent larger output
+_ZLIB_LEVELS = {'low': 1, 'medium': 6, 'high': 9}
+
+def _open_pdf_source(file_path):
+    """
+    Open a PDF file as a stream for pypdf, instead of letting it re-read the path
+
+    Returns:
+        tuple: (stream, int) - Read-only memory map for large files (read straight from
+        the page cache) or an in-memory copy made with a single read, and the file size
+    """
+    with open(file_path, 'rb', buffering=0) as f:
+        size = os.fstat(f.fileno()).st_size
+        if size >= _MMAP_MIN_SIZE:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ), size
+        return io.BytesIO(f.read()), size
+
+def _load_pdf(file_path):
+    """
+    Open and parse a PDF file
+
+    Returns:
+        tuple: (stream, int, PdfReader) - The open source stream, its size and the reader
+    """
+    source, size = _open_pdf_source(file_path)
+    try:
+        return source, size, PdfReader(source)
+    except Exception:
+        source.close()
+        raise
+
+def _serialize_pdf(writer, size_hint=0):
+    """
+    Serialize the PDF into an in-memory buffer
+
+    size_hint, the expected output size, is allocated up front so the buffer
+    does not have to grow, and copy its contents, repeatedly while writing.
+    """
+    buffer = io.BytesIO()
+    if size_hint > 0:
+        # Writing past the end extends the buffer in one allocation
+        buffer.seek(size_hint - 1)
+        buffer.write(b'\0')
+        buffer.seek(0)
+    writer.write_stream(buffer)
+    buffer.truncate()
+    return buffer
+
+def _store_pdf(buffer, output_path):
+    """Store a buffer from _serialize_pdf with a single write() call"""
+    with open(output_path, 'wb') as output_file, buffer.getbuffer() as data:
+        output_file.write(data)
+
+def _write_pdf_at_once(writer, output_path, size_hint=0):
+    """Serialize the PDF in memory, then store it with a single write() call"""
+    _store_pdf(_serialize_pdf(writer, size_hint), output_path)
+
+def _write_pdf(writer, output_path, input_size):
+    """
+    Write a merged PDF through a memory map of the output file
+
+    The file is pre-sized from the total input size, so the OS writes the mapped
+    pages back on its own schedule instead of the data passing through a write
+    buffer. If the PDF outgrows that estimate, or the output cannot be mapped,
+    it is written in one go instead.
+    """
+    size_hint = input_size + _OUTPUT_SIZE_MARGIN
+    if not (hasattr(os, 'posix_fallocate') or os.name == 'nt'):
+        # Without a way to reserve the disk blocks (e.g. macOS), a mapped write to a
+        # full disk crashes or loses pages instead of raising, so skip the mapping
+        _write_pdf_at_once(writer, output_path, size_hint)
+        return
+
+    fd = os.open(output_path, os.O_RDWR | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o666)
+    try:
+        try:
+            # Reserve the disk blocks up front, so a full disk fails here with an
+            # OSError rather than crashing (SIGBUS) when a mapped page is stored.
+            # Only Windows gets here without posix_fallocate; extending a file
+            # there allocates its blocks as well.
+            if hasattr(os, 'posix_fallocate'):
+                os.posix_fallocate(fd, 0, size_hint)
+            else:
+                os.ftruncate(fd, size_hint)
+            mapped_output = mmap.mmap(fd, size_hint)
+        except OSError:
+            # Out of space, or a filesystem or file type that cannot be mapped for
+            # writing (some network and FUSE mounts, devices)
+            mapped_output = None
+
+        written = None
+        if mapped_output is not None:
+            with mapped_output:
+                try:
+                    # write_stream() rather than write(): in newer pypdf releases (such as
+                    # the locked 6.20.0, but not 5.1.0) write() also flushes the stream,
+                    # which for a mapping is a synchronous msync of the whole file
+                    writer.write_stream(mapped_output)
+                    written = mapped_output.tell()
+                except ValueError:
+                    # Ran past the end of the mapping
+                    pass
+            if written is not None:
+                # The mapping must be closed before the file can shrink (required on Windows)
+                os.ftruncate(fd, written)
+    finally:
+        os.close(fd)
+
+    if mapped_output is None:
+        _write_pdf_at_once(writer, output_path, size_hint)
+    elif written is None:
+        # The PDF outgrew the estimate, so reserve well beyond it
+        _write_pdf_at_once(writer, output_path, 2 * size_hint)
+
+def _list_pdf_entries(folder):
+    """Return the os.DirEntry objects of the visible PDF files directly inside folder"""
+    entries = []
+    # The context manager closes the directory handle as soon as the scan ends
+    with os.scandir(folder) as scan:
+        for entry in scan:
+            name = entry.name
+            # Only the 4-character suffix is case-folded, and only when it is not already
+            # '.pdf'. Dotfiles are skipped: they include macOS '._name.pdf' resource forks.
+            suffix = name[-4:]
+            if (suffix == '.pdf' or suffix.lower() == '.pdf') and name[0] != '.' and entry.is_file():
+                entries.append(entry)
+    return entries
+
+def _list_pdf_files(folder):
+    """Return the names of the PDF files directly inside folder"""
+    return [entry.name for entry in _list_pdf_entries(folder)]
+
+def _natural_key(name):
+    """Sort key that compares runs of digits numerically, so file2 sorts before file10"""
+    # re.split with a capture group puts the digit runs at the odd indices
+    parts = tuple(int(part) if i % 2 else part
+                  for i, part in enumerate(_DIGIT_RUNS.split(name.lower())))
+    # Names that only differ in case or leading zeros ('A1.pdf', 'a01.pdf') fall back
+    # to the exact name, so the order does not depend on the directory listing order
+    return parts, name
+
+def _numbered_list(names):
+    """Format names as an indented, 1-based numbered list for a single log message"""
+    return "\n".join(f"  {i}. {name}" for i, name in enumerate(names, 1))
+
+def _run_qpdf(command):
+    """
+    Run a qpdf command line
+
+    Returns:
+        str: None if qpdf succeeded, otherwise a description of the failure
+    """
+    try:
+        # Exit code 3 means qpdf succeeded but reported warnings
+        result = subprocess.run(command, capture_output=True, text=True,
+                                creationflags=getattr(subprocess, 'CREATE_NO_WINDOW', 0))
+    except OSError as e:
+        # Found on PATH but not runnable (missing permissions, a broken shim), or
+        # a command line too long for the platform
+        return f"qpdf could not be run: {e}"
+    if result.returncode in (0, 3):
+        return None
+    return f"qpdf failed: {result.stderr.strip()}"
+
+def _merge_with_qpdf(qpdf, input_paths, output_path):
+    """
+    Concatenate the pages of input_paths into output_path with the qpdf binary
+
+    Only the pages are copied: document-level data such as bookmarks is dropped.
+
+    Returns:
+        bool: True if qpdf produced the output file, False otherwise
+    """
+    error = _run_qpdf([qpdf, '--empty', '--pages', *input_paths, '--', str(output_path)])
+    if error is None:
+        return True
+    logger.warning("Warning: %s, falling back to pypdf", error)
+    return False
+
+def _append_loaded_pdf(writer, pdf_file, load):
     """
-    Merge PDF files in alphabetical order
+    Append a PDF parsed by _load_pdf to writer, then release the input
+
+    Returns:
+        int: The size of the input file, or 0 if it could not be added
+    """
+    logger.debug("Adding: %s", pdf_file)
+    try:
+        source, size, reader = load.result()
+    except Exception as e:
+        logger.warning("Warning: Could not add %s: %s", pdf_file, e)
+        return 0
+    try:
+        writer.append(reader)
+    except Exception as e:
+        logger.warning("Warning: Could not add %s: %s", pdf_file, e)
+        return 0
+    finally:
+        _release_reader(writer, source, reader)
+    return size
+
+def _release_reader(writer, source, reader):
+    """Close an input that has been appended to writer and drop what was parsed from it"""
+    # The writer holds its own copies of the appended pages. pypdf still keeps the
+    # reader referenced from them, so its translation table and object cache are
+    # emptied explicitly.
+    source.close()
+    writer.reset_translation(reader)
+    reader.resolved_objects.clear()
+
+def _merge_with_pypdf(input_paths, pdf_files, output_path):
+    """Merge input_paths into output_path with pypdf, skipping files that cannot be read"""
+    # Create the writer that collects every page
+    writer = PdfWriter()
+
+    # Total size of the appended inputs, used to pre-size the output
+    input_size = 0
+
+    # Inputs are opened and parsed on a thread pool while the writer, which
+    # is not thread-safe, appends them one at a time in order. Only a few files
+    # are parsed ahead, and each is released once appended, so memory use does
+    # not grow with the number of inputs.
+    workers = min(8, len(input_paths))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        loads = deque()
+        for pdf_file, input_path in zip(pdf_files, input_paths):
+            loads.append((pdf_file, executor.submit(_load_pdf, input_path)))
+            if len(loads) > workers:
+                input_size += _append_loaded_pdf(writer, *loads.popleft())
+        while loads:
+            input_size += _append_loaded_pdf(writer, *loads.popleft())
+
+    # Inputs built from the same template repeat fonts, images and other
+    # resources; keep one copy of each identical object before writing
+    writer.compress_identical_objects()
+
+    # Write the merged PDF
+    _write_pdf(writer, output_path, input_size)
+
+def merge_pdfs_by_order(pdf_folder="files", output_filename="merged_output.pdf", exclude_output=True,
+                        use_qpdf=False):
+    """
+    Merge PDF files in natural alphabetical order (file2.pdf before file10.pdf)
 
     Args:
         pdf_folder (str): Path to folder containing PDF files (default: current directory)
         output_filename (str): Name of the output merged PDF file
         exclude_output (bool): Whether to exclude the output file from merging if it exists
+        use_qpdf (bool): Merge with the qpdf binary when it is installed. Faster, but
+            bookmarks are dropped and shared resources are not deduplicated.
 
     Returns:
         bool: True if successful, False otherwise
@@ -26,56 +290,46 @@ def merge_pdfs_by_order(pdf_folder="files", output_filename="merged_output.pdf",
         folder_path = Path(pdf_folder)
 
         if not folder_path.exists():
-            print(f"Error: Folder '{pdf_folder}' does not exist.")
+            logger.error("Error: Folder '%s' does not exist.", pdf_folder)
             return False
 
         # Find all PDF files in the folder
-        pdf_files = [f for f in os.listdir(folder_path) if f.lower().endswith('.pdf')]
+        pdf_files = _list_pdf_files(folder_path)
 
         # Exclude the output file if it exists and exclude_output is True
         if exclude_output and output_filename in pdf_files:
             pdf_files.remove(output_filename) 
 
         if not pdf_files:
-            print(f"No PDF files found in '{pdf_folder}'.")
+            logger.warning("No PDF files found in '%s'.", pdf_folder)
             return False
 
         # Sort alphabetically (natural sort for numbered files)
-        pdf_files.sort()
+        pdf_files.sort(key=_natural_key)
 
-        print(f"Found {len(pdf_files)} PDF files to merge:")
-        for i, pdf_file in enumerate(pdf_files, 1):
-            print(f"  {i}. {pdf_file}")
+        logger.info("Found %d PDF files to merge:\n%s", len(pdf_files), _numbered_list(pdf_files))
 
-        # Create merger object
-        merger = PyPDF2.PdfMerger()
+        # Plain string joins avoid building a Path object per file
+        folder_str = os.fspath(folder_path)
+        input_paths = [os.path.join(folder_str, pdf_file) for pdf_file in pdf_files]
 
-        # Add each PDF file to the merger
-        for pdf_file in pdf_files:
-            file_path = folder_path / pdf_file
-            try:
-                print(f"Adding: {pdf_file}")
-                merger.append(str(file_path))
-            except Exception as e:
-                print(f"Warning: Could not add {pdf_file}: {e}")
-                continue
-
-        # Write the merged PDF
         # Handle both absolute paths and relative filenames
         if os.path.isabs(output_filename):
             output_path = Path(output_filename)
         else:
             output_path = folder_path / output_filename
-        with open(output_path, 'wb') as output_file:
-            merger.write(output_file)
 
-        merger.close()
-        print(f"\nSuccessfully merged {len(pdf_files)} PDFs into '{output_filename}'")
-        print(f"Output file location: {output_path.absolute()}")
+        # On request, let qpdf copy the pages natively when it is installed
+        qpdf = shutil.which('qpdf') if use_qpdf else None
+        if not (qpdf and _merge_with_qpdf(qpdf, input_paths, output_path)):
+            _merge_with_pypdf(input_paths, pdf_files, output_path)
+
+        logger.info("Successfully merged %d PDFs into '%s'", len(pdf_files), output_filename)
+        logger.info("Output file location: %s", output_path.absolute())
         return True
 
     except Exception as e:
-        print(f"Error during PDF merging: {e}")
+        logger.error("Error during PDF merging: %s", e)
         return False
 
 def merge_specific_pdfs(pdf_files, output_filename="merged_specific.pdf"):
@@ -90,105 +344,159 @@ def merge_specific_pdfs(pdf_files, output_filename="merged_specific.pdf"):
         bool: True if successful, False otherwise
     """
     try:
-        # Validate that all files exist
-        missing_files = []
-        for pdf_file in pdf_files:
-            if not Path(pdf_file).exists():
-                missing_files.append(pdf_file)
+        logger.info("Merging %d specific PDF files:\n%s", len(pdf_files), _numbered_list(pdf_files))
 
-        if missing_files:
-            print(f"Error: The following files do not exist:")
-            for file in missing_files:
-                print(f"  - {file}")
-            return False
+        writer = PdfWriter()
 
-        print(f"Merging {len(pdf_files)} specific PDF files:")
-        for i, pdf_file in enumerate(pdf_files, 1):
-            print(f"  {i}. {pdf_file}")
-
-        merger = PyPDF2.PdfMerger()
+        # Parse each file once, even when it is listed several times, and release
+        # it once its last occurrence has been appended
+        remaining = Counter(os.path.abspath(pdf_file) for pdf_file in pdf_files)
+        loaded = {}
+        # Total size of the appended inputs, used to pre-size the output
+        input_size = 0
+        # Missing files are detected when opening them rather than by a separate stat pass
+        missing_files = []
 
         for pdf_file in pdf_files:
+            # Key on the absolute path so 'a.pdf' and './a.pdf' share one reader
+            source_key = os.path.abspath(pdf_file)
             try:
-                print(f"Adding: {pdf_file}")
-                merger.append(pdf_file)
+                logger.debug("Adding: %s", pdf_file)
+                if source_key not in loaded:
+                    loaded[source_key] = _load_pdf(pdf_file)
+                source, size, reader = loaded[source_key]
+                writer.append(reader)
+                input_size += size
+            except FileNotFoundError:
+                missing_files.append(pdf_file)
             except Exception as e:
-                print(f"Warning: Could not add {pdf_file}: {e}")
+                logger.warning("Warning: Could not add %s: %s", pdf_file, e)
                 continue
+            finally:
+                remaining[source_key] -= 1
+                if not remaining[source_key] and source_key in loaded:
+                    source, _, reader = loaded.pop(source_key)
+                    _release_reader(writer, source, reader)
+
+        if missing_files:
+            logger.error("Error: The following files do not exist:\n%s",
+                         "\n".join(f"  - {file}" for file in missing_files))
+            return False
+
+        # Repeating a file or merging inputs built from one template duplicates
+        # resources; keep one copy of each identical object before writing
+        writer.compress_identical_objects()
 
         # Handle both absolute paths and relative filenames
         output_path = Path(output_filename)
-        with open(output_path, 'wb') as output_file:
-            merger.write(output_file)
+        _write_pdf(writer, output_path, input_size)
 
-        merger.close()
-        print(f"\nSuccessfully merged PDFs into '{output_filename}'")
+        logger.info("Successfully merged PDFs into '%s'", output_filename)
         return True
 
     except Exception as e:
-        print(f"Error during PDF merging: {e}")
+        logger.error("Error during PDF merging: %s", e)
         return False
 
-def compress_pdf(input_file, output_file=None, compression_level='medium'):
+def _compress_with_qpdf(qpdf, input_path, output_path, compression_level, log_records):
     """
-    Compress a PDF file to reduce its size
+    Recompress every stream at the preset's zlib level with the qpdf binary
 
-    Args:
-        input_file (str): Path to input PDF file
-        output_file (str): Path to output compressed PDF file (optional, defaults to input_compressed.pdf)
-        compression_level (str): Compression level - 'low', 'medium', or 'high'
+    A failure is reported by appending a warning to log_records.
 
     Returns:
-        tuple: (bool, dict) - Success status and compression info (original_size, compressed_size, reduction_percent)
+        bool: True if qpdf produced the output file, False otherwise
     """
+    error = _run_qpdf([qpdf, '--object-streams=generate', '--compress-streams=y', '--recompress-flate',
+                       f'--compression-level={_ZLIB_LEVELS[compression_level]}', '--linearize',
+                       str(input_path), str(output_path)])
+    if error is None:
+        return True
+    log_records.append((logging.WARNING, "Warning: %s, falling back to pypdf", error))
+    return False
+
+def _deflate_stream_in_place(page, compression_level):
+    """Deflate a page's single content stream, keeping the original unless that saves space"""
+    stream = page['/Contents'].get_object()
+    if compression_level == 'low' and stream.get('/Filter') == '/FlateDecode':
+        # Already deflated; a low-effort pass only pays the decompress/compress cost
+        return
+    encoded = page.get_contents().flate_encode(_ZLIB_LEVELS[compression_level])
+    if len(encoded._data) < len(stream._data):
+        page.replace_contents(encoded)
+
+def _compress_page_contents(pages, compression_level, max_threads=None):
+    """Compress the content streams of all pages, running the zlib work on up to max_threads threads"""
+    # A page with a single indirect content stream gets its stream replaced in
+    # place, so pages with distinct streams can be compressed concurrently (zlib
+    # releases the GIL). Other layouts allocate new writer objects and stay serial.
+    in_place = {}
+    serial = []
+    for page in pages:
+        contents = page.get('/Contents')
+        if isinstance(contents, IndirectObject) and isinstance(contents.get_object(), StreamObject):
+            in_place.setdefault(contents.idnum, page)
+        else:
+            serial.append(page)
+
+    with ThreadPoolExecutor(max_workers=max_threads or os.cpu_count()) as executor:
+        list(executor.map(lambda page: _deflate_stream_in_place(page, compression_level),
+                          in_place.values()))
+
+    for page in serial:
+        page.compress_content_streams(level=_ZLIB_LEVELS[compression_level])
+
+def _compress_with_pypdf(input_path, output_path, compression_level, max_threads=None):
+    """Recompress page content streams with pypdf"""
+    # Large inputs are mapped so only the regions pypdf touches are paged in
+    source, input_size = _open_pdf_source(input_path)
     try:
-        input_path = Path(input_file)
+        # Read the PDF; cloning the document keeps its metadata, outline and forms
+        reader = PdfReader(source)
+        writer = PdfWriter(clone_from=reader)
 
-        if not input_path.exists():
-            print(f"Error: File '{input_file}' does not exist.")
-            return False, {}
+        _compress_page_contents(writer.pages, compression_level, max_threads)
 
-        # Get original file size
-        original_size = input_path.stat().st_size
+        # Recompression rarely makes a file larger, so its size bounds the buffer
+        compressed = _serialize_pdf(writer, input_size)
+    finally:
+        # Close the input before opening the output: it may be the same file, and
+        # Windows cannot truncate a file while a mapped view of it is open
+        source.close()
 
-        # Determine output file path
-        if output_file is None:
-            output_path = input_path.parent / f"{input_path.stem}_compressed.pdf"
-        else:
-            output_path = Path(output_file)
+    # Write compressed PDF
+    _store_pdf(compressed, output_path)
 
-        print(f"Compressing: {input_file}")
-        print(f"Original size: {original_size / 1024:.2f} KB")
+def _compress_pdf_known_size(input_path, output_path, compression_level, original_size, max_threads=None):
+    """
+    Compress input_path into output_path, given the input size the caller already has
 
-        # Read the PDF
-        reader = PyPDF2.PdfReader(str(input_path))
-        writer = PyPDF2.PdfWriter()
+    max_threads caps the threads used for page compression (default: one per CPU).
 
-        # Copy all pages to writer
-        for page in reader.pages:
-            # Compress page content
-            page.compress_content_streams()
-            writer.add_page(page)
+    This may run in a compress_folder worker process, where log handlers set up
+    by the caller are not available, so the report for the file is returned as
+    (level, msg, *args) records for the caller to pass to _log_records.
 
-        # Apply compression settings based on level
-        if compression_level in ['medium', 'high']:
-            # Remove duplicate objects
-            writer.add_metadata(reader.metadata)
+    Returns:
+        tuple: (bool, dict, list) - Same as compress_pdf, plus the log records
+    """
+    log_records = []
+    try:
+        log_records.append((logging.INFO, "Compressing: %s", input_path))
+        log_records.append((logging.INFO, "Original size: %.2f KB", original_size / 1024))
 
-        # Write compressed PDF
-        with open(output_path, 'wb') as output_f:
-            if compression_level == 'high':
-                writer.write(output_f)
-            else:
-                writer.write(output_f)
+        # Let qpdf handle 'high' natively when it is installed, otherwise use pypdf
+        qpdf = shutil.which('qpdf') if compression_level == 'high' else None
+        if not (qpdf and _compress_with_qpdf(qpdf, input_path, output_path, compression_level, log_records)):
+            _compress_with_pypdf(input_path, output_path, compression_level, max_threads)
 
         # Get compressed file size
-        compressed_size = output_path.stat().st_size
+        compressed_size = os.path.getsize(output_path)
         reduction_percent = ((original_size - compressed_size) / original_size) * 100
 
-        print(f"Compressed size: {compressed_size / 1024:.2f} KB")
-        print(f"Reduction: {reduction_percent:.1f}%")
-        print(f"Saved to: {output_path}")
+        log_records.append((logging.INFO, "Compressed size: %.2f KB", compressed_size / 1024))
+        log_records.append((logging.INFO, "Reduction: %.1f%%", reduction_percent))
+        log_records.append((logging.INFO, "Saved to: %s", output_path))
 
         info = {
             'original_size': original_size,
@@ -197,12 +505,67 @@ def compress_pdf(input_file, output_file=None, compression_level='medium'):
             'output_path': str(output_path)
         }
 
-        return True, info
+        return True, info, log_records
+
+    except Exception as e:
+        log_records.append((logging.ERROR, "Error during PDF compression: %s", e))
+        return False, {}, log_records
+
+def _log_records(log_records):
+    """Log the records returned by _compress_pdf_known_size"""
+    for level, msg, *args in log_records:
+        logger.log(level, msg, *args)
+
+def _check_compression_level(compression_level):
+    """Return compression_level if it is a known preset, otherwise warn and use 'medium'"""
+    if compression_level in _ZLIB_LEVELS:
+        return compression_level
+    logger.warning("Warning: Unknown compression level '%s', using 'medium' (choose low, medium or high)",
+                   compression_level)
+    return 'medium'
+
+def compress_pdf(input_file, output_file=None, compression_level='medium'):
+    """
+    Compress a PDF file to reduce its size
+
+    Args:
+        input_file (str): Path to input PDF file
+        output_file (str): Path to output compressed PDF file (optional, defaults to input_compressed.pdf)
+        compression_level (str): Compression level - 'low', 'medium', or 'high'
+
+    Returns:
+        tuple: (bool, dict) - Success status and compression info (original_size, compressed_size, reduction_percent)
+    """
+    compression_level = _check_compression_level(compression_level)
+    try:
+        input_path = Path(input_file)
+
+        # Get original file size; a missing file shows up here without a separate exists() check
+        try:
+            original_size = input_path.stat().st_size
+        except FileNotFoundError:
+            logger.error("Error: File '%s' does not exist.", input_file)
+            return False, {}
+
+        # Determine output file path
+        if output_file is None:
+            output_path = input_path.parent / f"{input_path.stem}_compressed.pdf"
+        else:
+            output_path = Path(output_file)
 
     except Exception as e:
-        print(f"Error during PDF compression: {e}")
+        logger.error("Error during PDF compression: %s", e)
         return False, {}
 
+    success, info, log_records = _compress_pdf_known_size(input_path, output_path,
+                                                          compression_level, original_size)
+    _log_records(log_records)
+    return success, info
+
+def _compress_pdf_star(args):
+    """Unpack an (input_path, output_path, compression_level, original_size, max_threads) task for the process pool"""
+    return _compress_pdf_known_size(*args)
+
 def compress_folder(pdf_folder, output_folder=None, compression_level='medium'):
     """
     Compress all PDF files in a folder
@@ -215,11 +578,12 @@ def compress_folder(pdf_folder, output_folder=None, compression_level='medium'):
     Returns:
         tuple: (bool, list) - Success status and list of compression results
     """
+    compression_level = _check_compression_level(compression_level)
     try:
         folder_path = Path(pdf_folder)
 
         if not folder_path.exists():
-            print(f"Error: Folder '{pdf_folder}' does not exist.")
+            logger.error("Error: Folder '%s' does not exist.", pdf_folder)
             return False, []
 
         # Determine output folder
@@ -231,27 +595,46 @@ def compress_folder(pdf_folder, output_folder=None, compression_level='medium'):
         # Create output folder if it doesn't exist
         output_path.mkdir(parents=True, exist_ok=True)
 
-        # Find all PDF files
-        pdf_files = [f for f in os.listdir(folder_path) if f.lower().endswith('.pdf')]
+        # Find all PDF files; the directory entries also carry each file's size
+        pdf_entries = _list_pdf_entries(folder_path)
 
-        if not pdf_files:
-            print(f"No PDF files found in '{pdf_folder}'.")
+        if not pdf_entries:
+            logger.warning("No PDF files found in '%s'.", pdf_folder)
             return False, []
 
-        pdf_files.sort()
+        pdf_entries.sort(key=lambda entry: _natural_key(entry.name))
+        pdf_files = [entry.name for entry in pdf_entries]
 
-        print(f"Found {len(pdf_files)} PDF files to compress")
+        logger.info("Found %d PDF files to compress", len(pdf_files))
 
         results = []
         total_original = 0
         total_compressed = 0
 
-        for pdf_file in pdf_files:
-            input_file_path = folder_path / pdf_file
-            output_file_path = output_path / pdf_file
-
-            success, info = compress_pdf(str(input_file_path), str(output_file_path), compression_level)
-
+        output_str = os.fspath(output_path)
+        # Files are compressed independently, so spread them across processes, and
+        # share the CPUs between them rather than giving each process a thread per CPU
+        cpu_count = os.cpu_count() or 1
+        process_count = min(cpu_count, len(pdf_entries))
+        threads_per_process = max(1, cpu_count // process_count)
+        tasks = [(entry.path, os.path.join(output_str, entry.name), compression_level,
+                  entry.stat().st_size, threads_per_process)
+                 for entry in pdf_entries]
+
+        if process_count == 1:
+            # A single worker gains nothing from a pool, and staying in-process does
+            # not re-import the caller's __main__
+            outcomes = [_compress_pdf_star(task) for task in tasks]
+        else:
+            # Spawn fresh interpreters instead of forking: the GUI starts this pool
+            # from a worker thread, and forking a multithreaded Qt process can deadlock
+            with ProcessPoolExecutor(max_workers=process_count,
+                                     mp_context=multiprocessing.get_context('spawn')) as executor:
+                outcomes = list(executor.map(_compress_pdf_star, tasks))
+
+        for pdf_file, (success, info, log_records) in zip(pdf_files, outcomes):
+            # Worker processes only collect their reports; log them here, in file order
+            _log_records(log_records)
             if success:
                 results.append({
                     'filename': pdf_file,
@@ -266,27 +649,30 @@ def compress_folder(pdf_folder, output_folder=None, compression_level='medium'):
                     'success': False
                 })
 
-            print()  # Empty line between files
-
         # Print summary
         if total_original > 0:
             total_reduction = ((total_original - total_compressed) / total_original) * 100
-            print("=" * 50)
-            print("COMPRESSION SUMMARY")
-            print("=" * 50)
-            print(f"Total original size: {total_original / (1024*1024):.2f} MB")
-            print(f"Total compressed size: {total_compressed / (1024*1024):.2f} MB")
-            print(f"Total reduction: {total_reduction:.1f}%")
-            print(f"Space saved: {(total_original - total_compressed) / (1024*1024):.2f} MB")
+            logger.info("%s\nCOMPRESSION SUMMARY\n%s", "=" * 50, "=" * 50)
+            logger.info("Total original size: %.2f MB", total_original / (1024*1024))
+            logger.info("Total compressed size: %.2f MB", total_compressed / (1024*1024))
+            logger.info("Total reduction: %.1f%%", total_reduction)
+            logger.info("Space saved: %.2f MB", (total_original - total_compressed) / (1024*1024))
 
         return True, results
 
     except Exception as e:
-        print(f"Error during folder compression: {e}")
+        logger.error("Error during folder compression: %s", e)
         return False, []
 
 def main():
     """Main function to handle command line usage"""
+    # Show this tool's progress messages on the console, as plain lines. The handler
+    # goes on our logger rather than the root, so pypdf's warnings stay on stderr.
+    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(console_handler)
+    logger.setLevel(logging.INFO)
+
     if len(sys.argv) > 1:
         # Command line usage
         if sys.argv[1] == "--help" or sys.argv[1] == "-h":
@@ -296,6 +682,7 @@ def main():
             print("    python merge_pdfs.py                    # Merge all PDFs in current directory")
             print("    python merge_pdfs.py output.pdf         # Merge all PDFs with custom output name")
             print("    python merge_pdfs.py folder/ output.pdf # Merge PDFs from specific folder")
+            print("    Add --qpdf to merge with qpdf if installed (faster, but drops bookmarks)")
             print("\n  Compress PDFs:")
             print("    python merge_pdfs.py --compress file.pdf                    # Compress single file")
             print("    python merge_pdfs.py --compress file.pdf output.pdf         # Compress with custom output")
@@ -307,15 +694,21 @@ def main():
             print("    python merge_pdfs.py --gui              # Launch GUI application")
             return
 
+        use_qpdf = '--qpdf' in sys.argv[1:]
+
         # Parse compression level
         compression_level = 'medium'
-        args = [arg for arg in sys.argv[1:] if not arg.startswith('--level=')]
+        args = [arg for arg in sys.argv[1:] if not arg.startswith('--level=') and arg != '--qpdf']
         for arg in sys.argv[1:]:
             if arg.startswith('--level='):
                 level = arg.split('=')[1].lower()
                 if level in ['low', 'medium', 'high']:
                     compression_level = level
 
+        if not args:
+            merge_pdfs_by_order(use_qpdf=use_qpdf)
+            return
+
         # Handle compress commands
         if args[0] == "--compress" and len(args) >= 2:
             input_file = args[1]
@@ -338,26 +731,45 @@ def main():
         # Handle merge commands (original behavior)
         if len(args) == 1:
             # Custom output filename
-            merge_pdfs_by_order(output_filename=args[0])
+            merge_pdfs_by_order(output_filename=args[0], use_qpdf=use_qpdf)
         elif len(args) == 2:
             # Custom folder and output filename
-            merge_pdfs_by_order(pdf_folder=args[0], output_filename=args[1])
+            merge_pdfs_by_order(pdf_folder=args[0], output_filename=args[1], use_qpdf=use_qpdf)
     else:
         # Default usage - merge all PDFs in current directory
         merge_pdfs_by_order()
 
-class MergeWorker(QThread):
-    """Worker thread for PDF merging to prevent GUI freezing"""
+class _SignalLogHandler(logging.Handler):
+    """Forward log messages from the current thread to a Qt signal, such as a worker's progress"""
+
+    def __init__(self, signal):
+        super().__init__(logging.INFO)
+        self.signal = signal
+        # Only forward the creating worker's messages, not those of a worker running alongside it
+        self.thread_id = threading.get_ident()
+
+    def emit(self, record):
+        if record.thread == self.thread_id:
+            self.signal.emit(self.format(record))
+
+class MergeWorkerSignals(QObject):
+    """Signals of a MergeWorker; a QRunnable is not a QObject and cannot define them itself"""
     progress = pyqtSignal(str)
     finished = pyqtSignal(bool, str)
 
+class MergeWorker(QRunnable):
+    """Thread pool task for PDF merging to prevent GUI freezing"""
+
     def __init__(self, pdf_files, output_filename, merge_mode='folder'):
         super().__init__()
+        self.signals = MergeWorkerSignals()
         self.pdf_files = pdf_files
         self.output_filename = output_filename
         self.merge_mode = merge_mode
 
     def run(self):
+        handler = _SignalLogHandler(self.signals.progress)
+        logger.addHandler(handler)
         try:
             if self.merge_mode == 'folder':
                 result = merge_pdfs_by_order(self.pdf_files, self.output_filename)
@@ -365,32 +777,41 @@ class MergeWorker(QThread):
                 result = merge_specific_pdfs(self.pdf_files, self.output_filename)
 
             if result:
-                self.finished.emit(True, f"Successfully merged PDFs into '{self.output_filename}'")
+                self.signals.finished.emit(True, f"Successfully merged PDFs into '{self.output_filename}'")
             else:
-                self.finished.emit(False, "Failed to merge PDFs")
+                self.signals.finished.emit(False, "Failed to merge PDFs")
         except Exception as e:
-            self.finished.emit(False, f"Error: {str(e)}")
+            self.signals.finished.emit(False, f"Error: {str(e)}")
+        finally:
+            logger.removeHandler(handler)
 
-class CompressionWorker(QThread):
-    """Worker thread for PDF compression to prevent GUI freezing"""
+class CompressionWorkerSignals(QObject):
+    """Signals of a CompressionWorker"""
     progress = pyqtSignal(str)
-    finished = pyqtSignal(bool, str, dict)
+    finished = pyqtSignal(bool, str, str)  # success, message, details
+
+class CompressionWorker(QRunnable):
+    """Thread pool task for PDF compression to prevent GUI freezing"""
 
     def __init__(self, input_path, output_path, compression_level='medium', compress_mode='file'):
         super().__init__()
+        self.signals = CompressionWorkerSignals()
         self.input_path = input_path
         self.output_path = output_path
         self.compression_level = compression_level
         self.compress_mode = compress_mode
 
     def run(self):
+        handler = _SignalLogHandler(self.signals.progress)
+        logger.addHandler(handler)
         try:
             if self.compress_mode == 'file':
                 success, info = compress_pdf(self.input_path, self.output_path, self.compression_level)
                 if success:
-                    self.finished.emit(True, "Compression completed successfully!", info)
+                    message = "Compression completed successfully!"
+                    self.signals.finished.emit(True, message, self._format_details(message, info))
                 else:
-                    self.finished.emit(False, "Failed to compress PDF", {})
+                    self.signals.finished.emit(False, "Failed to compress PDF", "")
             else:  # folder mode
                 success, results = compress_folder(self.input_path, self.output_path, self.compression_level)
                 if success:
@@ -405,20 +826,77 @@ class CompressionWorker(QThread):
                         'reduction_percent': total_reduction,
                         'files_count': len(results)
                     }
-                    self.finished.emit(True, f"Successfully compressed {len(results)} files!", info)
+                    message = f"Successfully compressed {len(results)} files!"
+                    self.signals.finished.emit(True, message, self._format_details(message, info))
                 else:
-                    self.finished.emit(False, "Failed to compress folder", {})
+                    self.signals.finished.emit(False, "Failed to compress folder", "")
         except Exception as e:
-            self.finished.emit(False, f"Error: {str(e)}", {})
+            self.signals.finished.emit(False, f"Error: {str(e)}", "")
+        finally:
+            logger.removeHandler(handler)
+
+    @staticmethod
+    def _format_details(message, info):
+        """Build the completion report here, so the GUI thread only has to show it"""
+        details = f"{message}\n\n"
+        if 'files_count' in info:
+            details += f"Files processed: {info['files_count']}\n"
+        details += f"Original size: {info['original_size'] / (1024*1024):.2f} MB\n"
+        details += f"Compressed size: {info['compressed_size'] / (1024*1024):.2f} MB\n"
+        details += f"Reduction: {info['reduction_percent']:.1f}%\n"
+        details += f"Space saved: {(info['original_size'] - info['compressed_size']) / (1024*1024):.2f} MB"
+        return details
+
+class FolderScanWorkerSignals(QObject):
+    """Signals of a FolderScanWorker"""
+    files_ready = pyqtSignal(list)
+
+class FolderScanWorker(QRunnable):
+    """Thread pool task that lists and sorts a folder's PDF files, so large folders do not freeze the GUI"""
+
+    def __init__(self, folder):
+        super().__init__()
+        self.signals = FolderScanWorkerSignals()
+        self.folder = folder
+        self.cancelled = False
+
+    def cancel(self):
+        """Drop the result of this scan; checked once the listing is done"""
+        self.cancelled = True
+
+    def run(self):
+        try:
+            pdf_files = _list_pdf_files(self.folder)
+        except OSError as e:
+            logger.warning("Warning: Could not read folder '%s': %s", self.folder, e)
+            pdf_files = []
+        pdf_files.sort(key=_natural_key)
+
+        # A newer folder selection has superseded this scan
+        if not self.cancelled:
+            self.signals.files_ready.emit(pdf_files)
 
 class PDFMergerGUI(QMainWindow):
     def __init__(self):
         super().__init__()
         self.selected_files = []
+        self._selected_set = set()  # Mirrors selected_files for O(1) duplicate checks
         self.output_folder = ""
         self.output_path = ""
         self.compress_input_path = ""
+        self.folder_scan_worker = None
         self.init_ui()
+
+        # Workers run on the shared pool, which reuses its threads between clicks
+        QThreadPool.globalInstance().setMaxThreadCount(min(4, os.cpu_count() or 1))
+
+        # Log messages are queued and appended in batches, so a burst of messages
+        # costs one layout/repaint per log instead of one per message
+        self._log_queue = deque()
+        self._compress_log_queue = deque()
+        self._log_timer = QTimer(self)
+        self._log_timer.timeout.connect(self._flush_logs)
+        self._log_timer.start(50)
         
     def init_ui(self):
         self.setWindowTitle("PDF Merger & Compressor Tool")
@@ -617,11 +1095,23 @@ class PDFMergerGUI(QMainWindow):
             
     def load_folder_files(self, folder):
         self.file_list.clear()
-        pdf_files = [f for f in os.listdir(folder) if f.lower().endswith('.pdf')]
-        pdf_files.sort()
+        if self.folder_scan_worker is not None:
+            # Drop the result of a scan still running for a previously selected folder
+            self.folder_scan_worker.cancel()
+
+        self.folder_scan_worker = FolderScanWorker(folder)
+        self.folder_scan_worker.signals.files_ready.connect(self.on_folder_files_ready)
+        QThreadPool.globalInstance().start(self.folder_scan_worker)
+
+    def on_folder_files_ready(self, pdf_files):
+        if self.folder_scan_worker is None or self.sender() is not self.folder_scan_worker.signals:
+            return
+        self.folder_scan_worker = None
         
-        for pdf_file in pdf_files:
-            self.file_list.addItem(pdf_file)
+        # Populate the list in one batch so the view lays out once
+        self.file_list.setUpdatesEnabled(False)
+        self.file_list.addItems(pdf_files)
+        self.file_list.setUpdatesEnabled(True)
         
         self.log(f"Found {len(pdf_files)} PDF files in folder")
         
@@ -630,15 +1120,22 @@ class PDFMergerGUI(QMainWindow):
             self, "Select PDF Files", "", "PDF Files (*.pdf)"
         )
         if files:
+            new_files = []
             for file in files:
-                if file not in self.selected_files:
-                    self.selected_files.append(file)
-                    self.file_list.addItem(os.path.basename(file))
+                if file not in self._selected_set:
+                    self._selected_set.add(file)
+                    new_files.append(file)
+            self.selected_files.extend(new_files)
+            
+            self.file_list.setUpdatesEnabled(False)
+            self.file_list.addItems([os.path.basename(f) for f in new_files])
+            self.file_list.setUpdatesEnabled(True)
             
             self.log(f"Added {len(files)} files")
             
     def clear_files(self):
         self.selected_files.clear()
+        self._selected_set.clear()
         self.file_list.clear()
         self.log("Cleared all selected files")
         
@@ -651,16 +1148,28 @@ class PDFMergerGUI(QMainWindow):
         )
         if file_path:
             # Ensure .pdf extension
-            if not file_path.lower().endswith('.pdf'):
+            if os.path.splitext(file_path)[1].lower() != '.pdf':
                 file_path += '.pdf'
             self.output_path = file_path
             self.output_path_field.setText(file_path)
             self.log(f"Output path set to: {file_path}")
         
     def log(self, message):
-        self.log_text.append(message)
-        self.log_text.verticalScrollBar().setValue(
-            self.log_text.verticalScrollBar().maximum()
+        self._log_queue.append(message)
+
+    def _flush_logs(self):
+        """Append all queued log messages to their log views"""
+        self._flush_log_queue(self._log_queue, self.log_text)
+        self._flush_log_queue(self._compress_log_queue, self.compress_log_text)
+
+    @staticmethod
+    def _flush_log_queue(queue, log_text):
+        if not queue:
+            return
+        messages = [queue.popleft() for _ in range(len(queue))]
+        log_text.append("\n".join(messages))
+        log_text.verticalScrollBar().setValue(
+            log_text.verticalScrollBar().maximum()
         )
         
     def merge_pdfs(self):
@@ -672,7 +1181,7 @@ class PDFMergerGUI(QMainWindow):
             return
             
         # Ensure .pdf extension
-        if not output_path.lower().endswith('.pdf'):
+        if os.path.splitext(output_path)[1].lower() != '.pdf':
             output_path += '.pdf'
             
         if self.output_folder:
@@ -691,9 +1200,9 @@ class PDFMergerGUI(QMainWindow):
         self.progress_bar.setRange(0, 0)  # Indeterminate progress
         
         self.worker = MergeWorker(files, output_filename, mode)
-        self.worker.progress.connect(self.log)
-        self.worker.finished.connect(self.on_merge_finished)
-        self.worker.start()
+        self.worker.signals.progress.connect(self.log)
+        self.worker.signals.finished.connect(self.on_merge_finished)
+        QThreadPool.globalInstance().start(self.worker)
         
     def on_merge_finished(self, success, message):
         self.progress_bar.setVisible(False)
@@ -723,7 +1232,7 @@ class PDFMergerGUI(QMainWindow):
             folder = QFileDialog.getExistingDirectory(self, "Select Folder to Compress")
             if folder:
                 self.compress_input_path = folder
-                pdf_count = len([f for f in os.listdir(folder) if f.lower().endswith('.pdf')])
+                pdf_count = len(_list_pdf_files(folder))
                 self.compress_input_label.setText(f"Folder: {folder} ({pdf_count} PDFs)")
                 self.compress_log(f"Selected folder: {folder} with {pdf_count} PDF files")
 
@@ -738,7 +1247,7 @@ class PDFMergerGUI(QMainWindow):
                 "PDF Files (*.pdf);;All Files (*)"
             )
             if file_path:
-                if not file_path.lower().endswith('.pdf'):
+                if os.path.splitext(file_path)[1].lower() != '.pdf':
                     file_path += '.pdf'
                 self.compress_output_field.setText(file_path)
                 self.compress_log(f"Output path set to: {file_path}")
@@ -751,10 +1260,7 @@ class PDFMergerGUI(QMainWindow):
 
     def compress_log(self, message):
         """Add message to compression log"""
-        self.compress_log_text.append(message)
-        self.compress_log_text.verticalScrollBar().setValue(
-            self.compress_log_text.verticalScrollBar().maximum()
-        )
+        self._compress_log_queue.append(message)
 
     def compress_pdfs(self):
         """Start PDF compression"""
@@ -783,25 +1289,16 @@ class PDFMergerGUI(QMainWindow):
         self.compress_progress_bar.setRange(0, 0)  # Indeterminate progress
 
         self.compress_worker = CompressionWorker(input_path, output_path, compression_level, mode)
-        self.compress_worker.progress.connect(self.compress_log)
-        self.compress_worker.finished.connect(self.on_compress_finished)
-        self.compress_worker.start()
+        self.compress_worker.signals.progress.connect(self.compress_log)
+        self.compress_worker.signals.finished.connect(self.on_compress_finished)
+        QThreadPool.globalInstance().start(self.compress_worker)
 
-    def on_compress_finished(self, success, message, info):
+    def on_compress_finished(self, success, message, details):
         """Handle compression completion"""
         self.compress_progress_bar.setVisible(False)
         self.compress_btn.setEnabled(True)
 
         if success:
-            # Build detailed message
-            details = f"{message}\n\n"
-            if 'files_count' in info:
-                details += f"Files processed: {info['files_count']}\n"
-            details += f"Original size: {info['original_size'] / (1024*1024):.2f} MB\n"
-            details += f"Compressed size: {info['compressed_size'] / (1024*1024):.2f} MB\n"
-            details += f"Reduction: {info['reduction_percent']:.1f}%\n"
-            details += f"Space saved: {(info['original_size'] - info['compressed_size']) / (1024*1024):.2f} MB"
-
             QMessageBox.information(self, "Success", details)
             self.compress_log("Compression completed successfully!")
             self.compress_log(details)
@@ -811,12 +1308,16 @@ class PDFMergerGUI(QMainWindow):
 
 def run_gui():
     """Run the GUI application"""
+    # Workers forward progress messages to the log views
+    logger.setLevel(logging.INFO)
     app = QApplication(sys.argv)
     window = PDFMergerGUI()
     window.show()
     sys.exit(app.exec())
 
 if __name__ == "__main__":
+    # Required for the compression process pool in frozen (PyInstaller) builds
+    multiprocessing.freeze_support()
     if len(sys.argv) > 1 and sys.argv[1] == "--gui":
         run_gui()
     else: